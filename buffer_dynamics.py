@@ -6,11 +6,10 @@ This module creates visualizations of buffer behavior during
 adaptive bitrate streaming playback.
 """
 
-import numpy as np
 import matplotlib.pyplot as plt
 from visualization_styles import (
     PRIMARY_RED, TEXT_BLACK, LIGHT_GRAY,
-    init_styled_plot, apply_style, set_styled_labels
+    init_styled_plot, apply_style, set_styled_labels, style_legend
 )
 
 
@@ -27,9 +26,9 @@ def create_buffer_dynamics_plot(initial_buffer=2.0, segment_length=2.0,
         empty_time: Time when the buffer becomes empty in seconds
         output_file: Path to save the output image
     """
-    # Create time points
-    t = np.array([0, empty_time, download_time, download_time + 0.1])
-    buffer = np.array([initial_buffer, 0, 0, segment_length])
+    # Create time points (plain tuples; matplotlib converts them once)
+    t = (0, empty_time, download_time, download_time + 0.1)
+    buffer = (initial_buffer, 0, 0, segment_length)
 
     # Initialize plot with styling
     fig, ax = init_styled_plot(figsize=(12, 7))
@@ -64,10 +63,7 @@ def create_buffer_dynamics_plot(initial_buffer=2.0, segment_length=2.0,
 
     # Customize legend
     legend = plt.legend()
-    legend.set_facecolor('white')
-    legend.set_edgecolor(LIGHT_GRAY)
-    for text in legend.get_texts():
-        text.set_color(TEXT_BLACK)
+    style_legend(legend)
 
     # Set axis limits
     plt.xlim(-0.5, download_time + 1)
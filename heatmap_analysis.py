@@ -9,12 +9,32 @@ across different segment lengths and smoothing window configurations.
 import numpy as np
 import matplotlib.pyplot as plt
 import seaborn as sns
-import pandas as pd
 from matplotlib.colors import LinearSegmentedColormap
 from visualization_styles import (
     PRIMARY_RED, TEXT_BLACK, LIGHT_GRAY, DARK_GRAY,
     apply_style, get_primary_cmap
 )
+from sweep_io import read_csv_cached
+
+# Largest grid dimension that still gets per-cell bitrate annotations
+MAX_ANNOTATED_GRID_SIZE = 50
+
+
+def _pivot_metric(df, metric):
+    """
+    Pivot a sweep metric into a segment length × smoothing window grid.
+    
+    Args:
+        df: DataFrame with sweep results
+        metric: Name of the column to place in the grid cells
+        
+    Returns:
+        pandas.DataFrame: Grid with sorted index and columns, missing cells as 0
+    """
+    # pivot_table tolerates repeated (L, N) rows, keeping the first one
+    grid = df.pivot_table(index='segment_length', columns='smooth_window',
+                          values=metric, aggfunc='first')
+    return grid.sort_index().sort_index(axis=1).fillna(0.0)
 
 
 def load_data(csv_file="sweep_results.csv"):
@@ -28,23 +48,16 @@ def load_data(csv_file="sweep_results.csv"):
         tuple: (segment_lengths, smoothing_windows, rebuffer_times, bitrates)
     """
     try:
-        df = pd.read_csv(csv_file)
+        df = read_csv_cached(csv_file)
         
-        # Extract unique values for segment lengths and smoothing windows
-        segment_lengths = sorted(df.segment_length.unique())
-        smoothing_windows = sorted(df.smooth_window.unique())
+        # Reshape the long-format results into (segment length × window) grids
+        rebuffer_grid = _pivot_metric(df, 'mean_stall')
+        bitrate_grid = _pivot_metric(df, 'mean_bitrate')
         
-        # Create matrices for rebuffer times and bitrates
-        rebuffer_times = np.zeros((len(segment_lengths), len(smoothing_windows)))
-        bitrates = np.zeros((len(segment_lengths), len(smoothing_windows)))
-        
-        # Fill matrices with data from CSV
-        for i, seg_len in enumerate(segment_lengths):
-            for j, window in enumerate(smoothing_windows):
-                row = df[(df.segment_length == seg_len) & (df.smooth_window == window)]
-                if not row.empty:
-                    rebuffer_times[i, j] = row.mean_stall.values[0]
-                    bitrates[i, j] = row.mean_bitrate.values[0]
+        segment_lengths = rebuffer_grid.index.tolist()
+        smoothing_windows = rebuffer_grid.columns.tolist()
+        rebuffer_times = rebuffer_grid.to_numpy()
+        bitrates = bitrate_grid.to_numpy()
         
         return segment_lengths, smoothing_windows, rebuffer_times, bitrates
     
@@ -87,19 +100,26 @@ def create_heatmap_analysis(segment_lengths, smoothing_windows,
         tuple: (figure, axes)
     """
     # Create figure with two subplots
-    fig, (ax1, ax2) = plt.subplots(1, 2, figsize=(15, 6))
+    fig, (ax1, ax2) = plt.subplots(1, 2, figsize=(15, 6), constrained_layout=True)
     fig.patch.set_facecolor('white')
     
-    # Apply styling to axes
-    apply_style(fig, [ax1, ax2])
+    # Apply styling to axes (no grid over the heatmap cells)
+    apply_style(fig, [ax1, ax2], image_mode=True)
 
     # Get primary colormap
     primary_cmap = get_primary_cmap()
 
+    # Format bitrate labels in one vectorized pass; per-cell text is
+    # unreadable (and slow to lay out) on very large grids, so skip it there
+    if max(bitrates.shape) <= MAX_ANNOTATED_GRID_SIZE:
+        annot = np.char.mod('%d', bitrates.astype(int))
+    else:
+        annot = False
+
     # Plot 1: Rebuffer times with bitrate text overlay
     sns.heatmap(rebuffer_times, 
-                annot=bitrates.astype(int),  # Overlay bitrate values
-                fmt='d',
+                annot=annot,  # Overlay bitrate values
+                fmt='',
                 cmap=primary_cmap,
                 ax=ax1,
                 cbar_kws={'label': 'Mean Rebuffer Time (s)'},
@@ -141,9 +161,12 @@ def create_heatmap_analysis(segment_lengths, smoothing_windows,
 
     # Customize colorbar labels
     for ax in [ax1, ax2]:
-        cbar = ax.collections[0].colorbar
-        cbar.ax.yaxis.label.set_color(TEXT_BLACK)
-        cbar.ax.yaxis.set_label_coords(3.0, 0.5)  # Adjust label position
+        mesh = ax.collections[0]
+        # Emit the color mesh as one raster image rather than a vector per cell
+        mesh.set_rasterized(True)
+        cbar = mesh.colorbar
+        # Space the label with labelpad so constrained layout accounts for it
+        cbar.set_label(cbar.ax.get_ylabel(), labelpad=10, color=TEXT_BLACK)
         cbar.ax.tick_params(colors=TEXT_BLACK)
 
     # Customize tick labels
@@ -152,8 +175,6 @@ def create_heatmap_analysis(segment_lengths, smoothing_windows,
         for label in ax.get_xticklabels() + ax.get_yticklabels():
             label.set_color(TEXT_BLACK)
 
-    plt.tight_layout()
-
     # Save with high DPI for quality
     plt.savefig(output_file, 
                 dpi=300, 
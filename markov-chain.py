@@ -6,92 +6,253 @@ This module simulates network conditions and ABR streaming playback
 using a Markov chain model to generate realistic bandwidth patterns.
 """
 
-import random
-import statistics
-import csv
+import numpy as np
+import pandas as pd
 import yaml
+from numba import njit, prange
 
+# Chains up to this many states step by linear scan instead of bisection
+MAX_LINEAR_SCAN_STATES = 5
 
-def simulate_throughput(num_steps, P, states):
+
+def transition_cdf(P):
+    """
+    Computes the row-wise cumulative transition probabilities.
+    
+    Args:
+        P: Transition probability matrix
+        
+    Returns:
+        Array with the same shape as P whose rows end at exactly 1.0
+    """
+    cdf = np.cumsum(np.ascontiguousarray(P, dtype=np.float64), axis=1)
+    cdf[:, -1] = 1.0  # guard against rows summing to slightly less than 1
+    return cdf
+
+
+@njit(inline="always")
+def _step_3state(cdf_row, u):
+    """Next state of a 3-state chain as two predictable comparisons."""
+    if u < cdf_row[0]:
+        return 0
+    if u < cdf_row[1]:
+        return 1
+    return 2
+
+
+@njit(inline="always")
+def _step_linear(cdf_row, u):
+    """Next state by linear scan, cheaper than bisection for short rows."""
+    last = cdf_row.shape[0] - 1
+    for j in range(last):
+        if u < cdf_row[j]:
+            return j
+    return last
+
+
+@njit(cache=True)
+def _simulate_throughput_core(cdf, states, uniforms):
+    """Compiled single-trace counterpart driven by pre-drawn uniforms."""
+    num_states = cdf.shape[0]
+    num_steps = uniforms.shape[0]
+    trace = np.empty(num_steps)
+    current = 0
+    for step in range(num_steps):
+        trace[step] = states[current]
+        if num_states == 3:
+            current = _step_3state(cdf[current], uniforms[step])
+        elif num_states <= MAX_LINEAR_SCAN_STATES:
+            current = _step_linear(cdf[current], uniforms[step])
+        else:
+            current = np.searchsorted(cdf[current], uniforms[step], side="right")
+    return trace
+
+
+def simulate_throughput(num_steps, P, states, runs=None, seed=None):
     """
     Simulates a Markov chain to generate throughput samples.
     
+    All runs are advanced together, one step at a time, by inverting the
+    cumulative transition probabilities of each run's current state.
+    
     Args:
         num_steps: Number of segments to simulate
         P: Transition probability matrix
         states: List of throughput states (kbps)
+        runs: Number of independent traces to draw (None for a single trace)
+        seed: Seed for the random number generator (None for fresh entropy)
         
     Returns:
-        List of throughput samples
+        Array of throughput samples, shaped (num_steps,) or (runs, num_steps)
     """
-    current = 0
-    trace = []
-    for _ in range(num_steps):
-        trace.append(states[current])
-        r = random.random()
-        cum = 0
-        for j, p in enumerate(P[current]):
-            cum += p
-            if r < cum:
-                current = j
-                break
-    return trace
+    cdf = transition_cdf(P)
+    states = np.ascontiguousarray(states, dtype=np.float64)
 
+    batch = 1 if runs is None else runs
+    uniforms = np.random.default_rng(seed).random((num_steps, batch))
+    current = np.zeros(batch, dtype=np.intp)
+    idx = np.empty((batch, num_steps), dtype=np.intp)
+    for step in range(num_steps):
+        idx[:, step] = current
+        r = uniforms[step]
+        current = (r[:, None] < cdf[current]).argmax(axis=1)
 
-def get_smoothed_throughput(trace, idx, window):
+    trace = states[idx]
+    return trace[0] if runs is None else trace
+
+
+def trailing_mean(trace, window):
     """
-    Computes moving average of throughput over specified window.
+    Computes the trailing moving average of throughput for every index.
+    
+    Uses a prefix sum so each average costs O(1) regardless of window size.
+    Early indices average over the samples available so far.
     
     Args:
-        trace: List of throughput samples
-        idx: Current index
+        trace: Array of throughput samples, or a (runs, num_steps) batch
         window: Number of samples to include in moving average
         
     Returns:
-        Average throughput over the window
+        Array of smoothed throughput, same shape as trace
     """
-    start = max(0, idx - window + 1)
-    return statistics.mean(trace[start : idx + 1])
+    trace = np.asarray(trace, dtype=np.float64)
+    n = trace.shape[-1]
+    csum = np.zeros(trace.shape[:-1] + (n + 1,))
+    np.cumsum(trace, axis=-1, out=csum[..., 1:])
+    idx = np.arange(n)
+    start = np.maximum(0, idx - window + 1)
+    counts = np.minimum(idx + 1, window)
+    return (csum[..., 1:] - csum[..., start]) / counts
 
 
-def simulate_playback(trace, segment_length=2.0, smooth_window=3):
+@njit("UniTuple(float64, 2)(float64[:], float64[:], float64, float64)",
+      cache=True, fastmath=True)
+def _playback_core(trace, smoothed, segment_length, initial_buffer):
     """
-    Simulates ABR playback with buffer management.
+    Compiled buffer accounting loop behind simulate_playback.
     
     Args:
-        trace: List of throughput samples
+        trace: Array of throughput samples
+        smoothed: Smoothed throughput used as the chosen bitrate per segment
         segment_length: Length of each segment in seconds
-        smooth_window: Number of samples for throughput smoothing
+        initial_buffer: Buffer level at startup in seconds
         
     Returns:
         Tuple of (average bitrate, total rebuffer time)
     """
-    buffer_sec = segment_length * smooth_window
+    buffer_sec = initial_buffer
     total_stall = 0.0
+    quality_sum = 0.0
 
-    for i, bw in enumerate(trace):
-        quality = get_smoothed_throughput(trace, i, smooth_window)
-        download_time = quality * segment_length / bw
+    for i in range(trace.shape[0]):
+        quality = smoothed[i]
+        download_time = quality * segment_length / trace[i]
 
         if buffer_sec >= download_time:
             buffer_sec -= download_time
         else:
-            stall = download_time - buffer_sec
-            total_stall += stall
+            total_stall += download_time - buffer_sec
             buffer_sec = 0.0
 
         buffer_sec += segment_length
+        quality_sum += quality
+
+    return quality_sum / trace.shape[0], total_stall
 
-    avg_bitrate = statistics.mean(
-        get_smoothed_throughput(trace, i, smooth_window)
-        for i in range(len(trace))
-    )
-    return avg_bitrate, total_stall
+
+@njit(cache=True)
+def _trailing_mean_core(trace, window):
+    """Compiled running-sum counterpart of trailing_mean."""
+    n = trace.shape[0]
+    smoothed = np.empty(n)
+    acc = 0.0
+    for i in range(n):
+        acc += trace[i]
+        if i >= window:
+            acc -= trace[i - window]
+        smoothed[i] = acc / min(i + 1, window)
+    return smoothed
+
+
+def simulate_playback(trace, segment_length=2.0, smooth_window=3):
+    """
+    Simulates ABR playback with buffer management.
+    
+    A single trace runs through the compiled playback loop; a batch of traces
+    runs through the same loop for every row in parallel.
+    
+    Args:
+        trace: Array of throughput samples, or a (runs, num_steps) batch
+        segment_length: Length of each segment in seconds
+        smooth_window: Number of samples for throughput smoothing
+        
+    Returns:
+        Tuple of (average bitrate, total rebuffer time); for a batch, each
+        is an array with one entry per run
+    """
+    trace = np.asarray(trace, dtype=np.float64)
+    smoothed = trailing_mean(trace, smooth_window)
+    initial_buffer = float(segment_length * smooth_window)
+    if trace.ndim == 2:
+        return _playback_batch(trace, smoothed,
+                               float(segment_length), initial_buffer)
+    return _playback_core(trace, smoothed,
+                          float(segment_length), initial_buffer)
+
+
+@njit(parallel=True, cache=True)
+def _monte_carlo_core(cdf, states, uniforms, segment_length, smooth_window):
+    """
+    Compiled Monte Carlo kernel running independent trials across all cores.
+    
+    Args:
+        cdf: Cumulative transition matrix from transition_cdf
+        states: Array of throughput states (kbps)
+        uniforms: Uniform draws shaped (runs, num_steps), one row per trial
+        segment_length: Length of each segment in seconds
+        smooth_window: Number of samples for throughput smoothing
+        
+    Returns:
+        Tuple of (average bitrate, total stall time) arrays, one entry per run
+    """
+    runs = uniforms.shape[0]
+    avg_q = np.empty(runs)
+    stall = np.empty(runs)
+    initial_buffer = segment_length * smooth_window
+    for r in prange(runs):
+        trace = _simulate_throughput_core(cdf, states, uniforms[r])
+        smoothed = _trailing_mean_core(trace, smooth_window)
+        avg_q[r], stall[r] = _playback_core(trace, smoothed,
+                                            segment_length, initial_buffer)
+    return avg_q, stall
+
+
+@njit(parallel=True, cache=True)
+def _playback_batch(traces, smoothed, segment_length, initial_buffer):
+    """
+    Compiled playback of every row of a trace matrix, in parallel.
+    
+    Args:
+        traces: Throughput samples shaped (runs, num_steps)
+        smoothed: Smoothed throughput with the same shape as traces
+        segment_length: Length of each segment in seconds
+        initial_buffer: Buffer level at startup in seconds
+        
+    Returns:
+        Tuple of (average bitrate, total stall time) arrays, one entry per row
+    """
+    runs = traces.shape[0]
+    avg_q = np.empty(runs)
+    stall = np.empty(runs)
+    for r in prange(runs):
+        avg_q[r], stall[r] = _playback_core(traces[r], smoothed[r],
+                                            segment_length, initial_buffer)
+    return avg_q, stall
 
 
 def monte_carlo(P, states, num_steps=150,
                 segment_length=2.0, smooth_window=3,
-                runs=100):
+                runs=100, seed=None):
     """
     Runs Monte Carlo simulation to estimate ABR performance.
     
@@ -102,30 +263,33 @@ def monte_carlo(P, states, num_steps=150,
         segment_length: Length of each segment in seconds
         smooth_window: Number of samples for throughput smoothing
         runs: Number of Monte Carlo trials
+        seed: Seed for the random number generator (None for fresh entropy)
         
     Returns:
         List of (average bitrate, total stall time) tuples for each run
     """
-    results = []
-    for _ in range(runs):
-        trace = simulate_throughput(num_steps, P, states)
-        avg_q, total_stall = simulate_playback(
-            trace,
-            segment_length=segment_length,
-            smooth_window=smooth_window
-        )
-        results.append((avg_q, total_stall))
-    return results
+    # Draw every uniform up front in one PCG64 call; the kernel only indexes
+    uniforms = np.random.default_rng(seed).random((runs, num_steps))
+    avg_q, stall = _monte_carlo_core(
+        transition_cdf(P),
+        np.ascontiguousarray(states, dtype=np.float64),
+        uniforms,
+        float(segment_length),
+        smooth_window
+    )
+    return list(zip(avg_q.tolist(), stall.tolist()))
 
 
 def parameter_sweep(P, states,
                     num_steps=150,
                     segment_lengths=(2.0, 4.0, 6.0),
                     smooth_windows=(1, 3, 5, 7),
-                    runs=100):
+                    runs=100, seed=None):
     """
     Performs parameter sweep over segment lengths and smoothing windows.
     Writes results to CSV file with mean and standard deviation metrics.
+    One batch of throughput traces is drawn up front and shared by all
+    parameter combinations.
     
     Args:
         P: Transition probability matrix
@@ -134,30 +298,34 @@ def parameter_sweep(P, states,
         segment_lengths: List of segment lengths to test
         smooth_windows: List of smoothing windows to test
         runs: Number of Monte Carlo trials for each parameter combination
+        seed: Seed for the random number generator (None for fresh entropy)
     """
-    with open("sweep_results.csv", "w", newline="") as f:
-        writer = csv.writer(f)
-        writer.writerow([
-            "segment_length", "smooth_window",
-            "mean_bitrate", "sd_bitrate",
-            "mean_stall", "sd_stall"
-        ])
-        for seg_len in segment_lengths:
-            for w in smooth_windows:
-                data = monte_carlo(
-                    P, states,
-                    num_steps=num_steps,
-                    segment_length=seg_len,
-                    smooth_window=w,
-                    runs=runs
-                )
-                qs = [d[0] for d in data]
-                stl = [d[1] for d in data]
-                writer.writerow([
-                    seg_len, w,
-                    statistics.mean(qs), statistics.stdev(qs),
-                    statistics.mean(stl), statistics.stdev(stl)
-                ])
+    # Every configuration is evaluated on the same traces (common random
+    # numbers), so differences between rows reflect L and N, not sampling noise
+    traces = simulate_throughput(num_steps, P, states, runs=runs, seed=seed)
+
+    # Smoothing depends only on the window, so it is computed once per window
+    # and shared by every segment length
+    out = np.empty((len(segment_lengths) * len(smooth_windows), 6))
+    for j, w in enumerate(smooth_windows):
+        smoothed = trailing_mean(traces, w)
+        for i, seg_len in enumerate(segment_lengths):
+            qs, stl = _playback_batch(traces, smoothed,
+                                      float(seg_len), float(seg_len * w))
+            out[i * len(smooth_windows) + j] = (
+                seg_len, w,
+                qs.mean(), qs.std(ddof=1),
+                stl.mean(), stl.std(ddof=1)
+            )
+
+    df = pd.DataFrame(out, columns=[
+        "segment_length", "smooth_window",
+        "mean_bitrate", "sd_bitrate",
+        "mean_stall", "sd_stall"
+    ])
+    # Keep the '.0' of whole-number lengths; plots show them as L=2.0s
+    df["segment_length"] = df["segment_length"].map(str)
+    df.to_csv("sweep_results.csv", index=False, float_format="%.6g")
     print("Wrote sweep_results.csv")
 
 
@@ -203,9 +371,13 @@ def main():
         smooth_windows = [1, 3, 5, 7]
         runs = 100
 
+    # Convert the YAML lists once so every simulation gets contiguous arrays
+    P = np.ascontiguousarray(P, dtype=np.float64)
+    states = np.ascontiguousarray(states, dtype=np.float64)
+
     # Run a single simulation to demonstrate functionality
     trace = simulate_throughput(num_steps, P, states)
-    print("Throughput trace (first 20 steps):", trace[:20])
+    print("Throughput trace (first 20 steps):", trace[:20].tolist())
 
     # Run a single playback simulation
     avg_q, total_stall = simulate_playback(trace,
@@ -224,11 +396,10 @@ def main():
     )
 
     # Compute summary statistics
-    avg_qs = [r[0] for r in data]
-    stalls = [r[1] for r in data]
+    avg_qs, stalls = np.asarray(data).T
     print("=== Monte Carlo summary (n=100) ===")
-    print(f"Avg bitrate: {statistics.mean(avg_qs):.1f} ± {statistics.stdev(avg_qs):.1f} kbps")
-    print(f"Rebuffer  : {statistics.mean(stalls):.1f} ± {statistics.stdev(stalls):.1f} sec")
+    print(f"Avg bitrate: {avg_qs.mean():.1f} ± {avg_qs.std(ddof=1):.1f} kbps")
+    print(f"Rebuffer  : {stalls.mean():.1f} ± {stalls.std(ddof=1):.1f} sec")
 
     # Run parameter sweep
     print("Running parameter sweep...")
@@ -6,9 +6,9 @@ This module creates visualization of performance trade-offs between
 different segment lengths and smoothing window configurations.
 """
 
-import pandas as pd
 import matplotlib.pyplot as plt
 import numpy as np
+from sweep_io import read_csv_cached
 
 # Brand colors and complementary colors
 PRIMARY_RED = '#E50914'
@@ -33,36 +33,32 @@ def load_data(csv_file="sweep_results.csv"):
         csv_file: Path to the CSV file containing sweep results
         
     Returns:
-        pandas.DataFrame: DataFrame with sweep results
+        pandas.DataFrame or dict: Sweep results; sample data is returned as
+        a dict mapping column names to NumPy arrays
     """
     try:
-        return pd.read_csv(csv_file)
+        return read_csv_cached(csv_file)
     except FileNotFoundError:
         print(f"File {csv_file} not found. Creating sample data.")
         # Create sample data if file not found
-        segment_lengths = [2.0, 4.0, 6.0]
-        smooth_windows = [1, 3, 5, 7]
+        segment_lengths = np.array([2.0, 4.0, 6.0])
+        smooth_windows = np.array([1, 3, 5, 7])
         
-        # Create empty dataframe with the same structure
-        columns = ["segment_length", "smooth_window", 
-                   "mean_bitrate", "sd_bitrate", 
-                   "mean_stall", "sd_stall"]
-        df = pd.DataFrame(columns=columns)
+        # Grid indices in sweep results CSV row order (segment length major)
+        i, j = np.meshgrid(np.arange(len(segment_lengths)),
+                           np.arange(len(smooth_windows)),
+                           indexing='ij')
+        i, j = i.ravel(), j.ravel()
+        no_smoothing = smooth_windows[j] == 1
         
-        # Fill with sample data
-        for i, seg_len in enumerate(segment_lengths):
-            for j, window in enumerate(smooth_windows):
-                row = {
-                    "segment_length": seg_len,
-                    "smooth_window": window,
-                    "mean_bitrate": 1000 + i*200 - j*50,
-                    "sd_bitrate": 70 + np.random.uniform(-10, 10),
-                    "mean_stall": 0 if window == 1 else (j*10 + i*20),
-                    "sd_stall": 0 if window == 1 else (j*5 + i*2)
-                }
-                df = pd.concat([df, pd.DataFrame([row])], ignore_index=True)
-        
-        return df
+        return {
+            "segment_length": segment_lengths[i],
+            "smooth_window": smooth_windows[j],
+            "mean_bitrate": 1000 + i*200 - j*50,
+            "sd_bitrate": 70 + np.random.uniform(-10, 10, size=i.size),
+            "mean_stall": np.where(no_smoothing, 0, j*10 + i*20),
+            "sd_stall": np.where(no_smoothing, 0, j*5 + i*2)
+        }
 
 
 def create_tradeoff_plots(df, output_file="tradeoff_analysis.png"):
@@ -70,7 +66,7 @@ def create_tradeoff_plots(df, output_file="tradeoff_analysis.png"):
     Create trade-off analysis plots for streaming performance metrics.
     
     Args:
-        df: DataFrame with sweep results
+        df: DataFrame (or dict of arrays) with sweep results
         output_file: Path to save the output image
         
     Returns:
@@ -80,19 +76,30 @@ def create_tradeoff_plots(df, output_file="tradeoff_analysis.png"):
     plt.style.use('default')
 
     # Create figure with two subplots
-    fig, (ax1, ax2) = plt.subplots(1, 2, figsize=(15, 6))
+    fig, (ax1, ax2) = plt.subplots(1, 2, figsize=(15, 6), constrained_layout=True)
     fig.patch.set_facecolor('white')
 
-    # Overlay rebuffer curves
-    for i, seg_len in enumerate(sorted(df.segment_length.unique())):
-        sub = df[df.segment_length == seg_len]
-        ax1.plot(sub.smooth_window,
-                 sub.mean_stall,
-                 marker="o",
-                 color=COLORS[i % len(COLORS)],
-                 linewidth=2.5,
-                 markersize=8,
-                 label=f"{seg_len}s segments")
+    # Work on plain arrays whether given a DataFrame or a dict of arrays,
+    # sorted so each segment length is a contiguous run of windows
+    seg = np.asarray(df['segment_length'])
+    window = np.asarray(df['smooth_window'])
+    order = np.lexsort((window, seg))
+    seg, window = seg[order], window[order]
+    stall = np.asarray(df['mean_stall'])[order]
+    bitrate = np.asarray(df['mean_bitrate'])[order]
+    seg_lens, starts = np.unique(seg, return_index=True)
+    bounds = np.append(starts, len(seg))
+
+    # Overlay rebuffer and bitrate curves, one segment length at a time
+    for i, seg_len in enumerate(seg_lens):
+        rows = slice(bounds[i], bounds[i + 1])
+        line_style = dict(marker="o",
+                          color=COLORS[i % len(COLORS)],
+                          linewidth=2.5,
+                          markersize=8,
+                          label=f"{seg_len}s segments")
+        ax1.plot(window[rows], stall[rows], **line_style)
+        ax2.plot(window[rows], bitrate[rows], **line_style)
 
     ax1.set_title("Mean Rebuffer Time vs. Smoothing Window", 
                   color=PRIMARY_BLACK, 
@@ -114,17 +121,6 @@ def create_tradeoff_plots(df, output_file="tradeoff_analysis.png"):
         text.set_color(PRIMARY_BLACK)
     ax1.tick_params(colors=PRIMARY_BLACK)
 
-    # Overlay bitrate curves
-    for i, seg_len in enumerate(sorted(df.segment_length.unique())):
-        sub = df[df.segment_length == seg_len]
-        ax2.plot(sub.smooth_window,
-                 sub.mean_bitrate,
-                 marker="o",
-                 color=COLORS[i % len(COLORS)],
-                 linewidth=2.5,
-                 markersize=8,
-                 label=f"{seg_len}s segments")
-
     ax2.set_title("Mean Chosen Bitrate vs. Smoothing Window", 
                   color=PRIMARY_BLACK, 
                   fontsize=14, 
@@ -157,8 +153,6 @@ def create_tradeoff_plots(df, output_file="tradeoff_analysis.png"):
                  fontsize=16, 
                  y=1.05)
 
-    plt.tight_layout()
-
     # Save with high DPI for quality
     plt.savefig(output_file, 
                 dpi=300, 
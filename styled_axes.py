@@ -0,0 +1,71 @@
+#!/usr/bin/env python3
+"""
+Axes Class for Styled ABR Streaming Plots
+
+This module holds the Axes subclass that init_styled_plot creates its
+axes from. It imports matplotlib at module level, so visualization_styles
+only imports it once a figure is actually created.
+"""
+
+import matplotlib
+import numpy as np
+from matplotlib.axes import Axes
+
+# imshow defaults for image_mode axes: draw pixels as-is, no resampling
+IMAGE_RC = {'image.interpolation': 'nearest', 'image.resample': False}
+
+
+def _num_points(args, kwargs):
+    """
+    Estimate the number of data points passed to a plotting call.
+    
+    Args:
+        args: Positional arguments of the call
+        kwargs: Keyword arguments of the call
+        
+    Returns:
+        int: Size of the largest array-like argument
+    """
+    data = [a for a in args if not isinstance(a, str)]
+    data += [kwargs[k] for k in ('x', 'y') if k in kwargs]
+    return max((np.size(a) for a in data), default=0)
+
+
+class StyledAxes(Axes):
+    """
+    Axes that rasterize dense plot/scatter artists and can default images
+    to nearest-neighbour drawing.
+    
+    Defined at module level so figures using it can still be pickled.
+    
+    Attributes:
+        rasterize_threshold: Point count above which plot/scatter artists
+            are rasterized; None to never rasterize automatically
+        image_mode: Run imshow under IMAGE_RC. Interpolation settings are
+            read from rcParams when imshow runs, so arguments left unset or
+            passed as None (as pyplot.imshow does) pick up those defaults;
+            explicit values still win
+    """
+
+    rasterize_threshold = None
+    image_mode = False
+
+    def _rasterize_if_dense(self, args, kwargs):
+        """Set rasterized=True in kwargs for dense calls that leave it unset."""
+        if (self.rasterize_threshold is not None and 'rasterized' not in kwargs
+                and _num_points(args, kwargs) > self.rasterize_threshold):
+            kwargs['rasterized'] = True
+
+    def plot(self, *args, **kwargs):
+        self._rasterize_if_dense(args, kwargs)
+        return super().plot(*args, **kwargs)
+
+    def scatter(self, *args, **kwargs):
+        self._rasterize_if_dense(args, kwargs)
+        return super().scatter(*args, **kwargs)
+
+    def imshow(self, *args, **kwargs):
+        if not self.image_mode:
+            return super().imshow(*args, **kwargs)
+        with matplotlib.rc_context(IMAGE_RC):
+            return super().imshow(*args, **kwargs)
@@ -0,0 +1,41 @@
+#!/usr/bin/env python3
+"""
+Sweep Results I/O for ABR Streaming Simulation
+
+This module reads the parameter sweep results shared by the plotting
+scripts, parsing each CSV file once per process while it is unchanged.
+"""
+
+import os
+from functools import lru_cache
+
+import pandas as pd
+
+
+@lru_cache(maxsize=4)
+def _read_csv_cached(csv_file, mtime):
+    """
+    Parse a CSV file once per (path, modification time) pair.
+    
+    The returned DataFrame is shared between callers and must not be mutated.
+    """
+    return pd.read_csv(csv_file)
+
+
+def read_csv_cached(csv_file):
+    """
+    Read a CSV file, reusing the parsed result while the file is unchanged.
+    
+    One cache serves every plotting script imported into the process, so
+    the sweep results are parsed once even when several scripts load them.
+    
+    Args:
+        csv_file: Path to the CSV file
+        
+    Returns:
+        pandas.DataFrame: Shared parsed contents, which must not be mutated
+        
+    Raises:
+        FileNotFoundError: If csv_file does not exist
+    """
+    return _read_csv_cached(csv_file, os.path.getmtime(csv_file))
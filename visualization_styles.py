@@ -4,10 +4,16 @@ Common Visualization Styles for ABR Streaming Simulation
 
 This module provides consistent styling and color schemes
 for all visualizations in the ABR streaming simulation project.
+
+Matplotlib is imported lazily inside the functions that need it, so
+importing the color constants does not pay matplotlib's start-up cost.
 """
 
-import matplotlib.pyplot as plt
-from matplotlib.colors import LinearSegmentedColormap
+import os
+import sys
+from functools import lru_cache
+
+import numpy as np
 
 # Brand colors
 PRIMARY_RED = '#E50914'
@@ -15,43 +21,93 @@ TEXT_BLACK = '#141414'
 DARK_GRAY = '#1F1F1F'
 LIGHT_GRAY = '#808080'
 
+
+def _hex_to_rgba(hex_color):
+    """
+    Convert a '#RRGGBB' color to an RGBA tuple without importing matplotlib.
+    
+    Args:
+        hex_color: Hex color string
+        
+    Returns:
+        tuple: (red, green, blue, alpha) floats in [0, 1]
+    """
+    value = int(hex_color[1:], 16)
+    return ((value >> 16 & 0xFF) / 255,
+            (value >> 8 & 0xFF) / 255,
+            (value & 0xFF) / 255,
+            1.0)
+
+
+# Pre-parsed brand colors; matplotlib setters take RGBA tuples as-is
+_PRIMARY_RED_RGBA = _hex_to_rgba(PRIMARY_RED)
+_TEXT_BLACK_RGBA = _hex_to_rgba(TEXT_BLACK)
+_LIGHT_GRAY_RGBA = _hex_to_rgba(LIGHT_GRAY)
+
 # Color palette for different segment lengths
-SEGMENT_COLORS = [
+SEGMENT_COLORS = (
     PRIMARY_RED,     # Primary red
     '#1A75FF',       # Complementary blue
     '#00B300'        # Complementary green
-]
+)
+SEGMENT_COLORS_RGBA = tuple(_hex_to_rgba(c) for c in SEGMENT_COLORS)
+
+# Color stops of the primary colormap, from white to the primary red
+PRIMARY_CMAP_STOPS = ('#FFFFFF', PRIMARY_RED)
+
+# Style sheet equivalent of apply_style, shipped next to this module
+STYLE_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                          'visualization_styles.mplstyle')
 
 
-def apply_style(fig, axes):
+def _flatten_axes(axes):
+    """
+    Flatten a single axis, a sequence or a grid (ndarray) of axes.
+    
+    Args:
+        axes: Axis object, list/tuple of axes or array of axes
+        
+    Returns:
+        tuple: Axes in row-major order
+    """
+    if hasattr(axes, 'spines'):
+        return (axes,)
+    return tuple(np.ravel(axes))
+
+
+def apply_style(fig, axes, image_mode=False):
     """
     Apply consistent styling to figure and axes.
     
+    Figures from init_styled_plot, or created after apply_project_style,
+    are already styled; use this for other figures.
+    
     Args:
         fig: Matplotlib figure object
-        axes: List of axes objects (or single axis)
+        axes: Single axis, list/tuple of axes or array of axes from plt.subplots
+        image_mode: Leave out the grid, for axes showing images or heatmaps;
+            unlike init_styled_plot this does not change imshow defaults
     """
-    # Convert single axis to list for consistent handling
-    if not isinstance(axes, list) and not isinstance(axes, tuple):
-        axes = [axes]
+    from matplotlib.artist import setp
+
+    axes = _flatten_axes(axes)
     
-    # Set figure background to white
+    # Set figure and axis backgrounds to white
     fig.patch.set_facecolor('white')
+    setp(axes, facecolor='white')
     
     for ax in axes:
-        # Set axis background to white
-        ax.set_facecolor('white')
-        
-        # Apply styled borders
-        for spine in ax.spines.values():
-            spine.set_color(LIGHT_GRAY)
-            spine.set_linewidth(1.5)
+        # Apply styled borders to all spines at once
+        setp(tuple(ax.spines.values()), color=_LIGHT_GRAY_RGBA, linewidth=1.5)
         
         # Style tick labels
-        ax.tick_params(colors=TEXT_BLACK)
+        ax.tick_params(colors=_TEXT_BLACK_RGBA)
         
-        # Style grid
-        ax.grid(True, linestyle='--', alpha=0.3, color=LIGHT_GRAY)
+        # Style grid; images and heatmaps get none, it only adds draw work
+        if image_mode:
+            ax.grid(False)
+        else:
+            ax.grid(True, linestyle='--', alpha=0.3, color=_LIGHT_GRAY_RGBA)
 
 
 def style_legend(legend):
@@ -61,22 +117,32 @@ def style_legend(legend):
     Args:
         legend: Matplotlib legend object
     """
-    legend.set_facecolor('white')
-    legend.set_edgecolor(LIGHT_GRAY)
-    
-    for text in legend.get_texts():
-        text.set_color(TEXT_BLACK)
+    from matplotlib.artist import setp
+
+    # The legend's background and border belong to its frame patch
+    setp(legend.get_frame(), facecolor='white', edgecolor=_LIGHT_GRAY_RGBA)
+    setp(legend.get_texts(), color=_TEXT_BLACK_RGBA)
 
 
+@lru_cache(maxsize=1)
 def get_primary_cmap():
     """
     Create a primary-colored colormap.
     
+    The colormap is built once, registered with matplotlib as 'primary_red'
+    and shared by every caller afterwards, so it must not be modified.
+    
     Returns:
         matplotlib.colors.LinearSegmentedColormap: Brand-styled colormap
     """
-    return LinearSegmentedColormap.from_list('primary_red', 
-                                            ['#FFFFFF', PRIMARY_RED])
+    import matplotlib
+    from matplotlib.colors import LinearSegmentedColormap
+
+    cmap = LinearSegmentedColormap.from_list('primary_red',
+                                             PRIMARY_CMAP_STOPS, N=256)
+    if 'primary_red' not in matplotlib.colormaps:
+        matplotlib.colormaps.register(cmap)
+    return cmap
 
 
 def set_styled_labels(ax, title="", xlabel="", ylabel="", fontsize_title=14, fontsize_labels=12):
@@ -92,30 +158,281 @@ def set_styled_labels(ax, title="", xlabel="", ylabel="", fontsize_title=14, fon
         fontsize_labels: Font size for axis labels
     """
     if title:
-        ax.set_title(title, color=TEXT_BLACK, fontsize=fontsize_title, pad=20)
+        ax.set_title(title, color=_TEXT_BLACK_RGBA, fontsize=fontsize_title, pad=20)
     if xlabel:
-        ax.set_xlabel(xlabel, color=TEXT_BLACK, fontsize=fontsize_labels)
+        ax.set_xlabel(xlabel, color=_TEXT_BLACK_RGBA, fontsize=fontsize_labels)
     if ylabel:
-        ax.set_ylabel(ylabel, color=TEXT_BLACK, fontsize=fontsize_labels)
+        ax.set_ylabel(ylabel, color=_TEXT_BLACK_RGBA, fontsize=fontsize_labels)
+
+
+def set_styled_labels_batch(axes, titles=None, xlabels=None, ylabels=None,
+                            fontsize_title=14, fontsize_labels=12):
+    """
+    Set styled labels on many axes at once, e.g. a grid from plt.subplots.
+    
+    Axis labels are filled in on their existing Text artists and styled
+    together with one setp call rather than per-axis set_xlabel/set_ylabel.
+    
+    Args:
+        axes: List/tuple or array of axes, labelled in row-major order
+        titles: Title text per axis (None or empty strings to skip)
+        xlabels: X-axis label text per axis (None or empty strings to skip)
+        ylabels: Y-axis label text per axis (None or empty strings to skip)
+        fontsize_title: Font size for titles
+        fontsize_labels: Font size for axis labels
+    """
+    from matplotlib.artist import setp
+
+    axes = _flatten_axes(axes)
+
+    for ax, title in zip(axes, titles or ()):
+        if title:
+            ax.set_title(title, color=_TEXT_BLACK_RGBA, fontsize=fontsize_title, pad=20)
+
+    labels = []
+    for axis_name, texts in (('xaxis', xlabels), ('yaxis', ylabels)):
+        for ax, text in zip(axes, texts or ()):
+            if text:
+                label = getattr(ax, axis_name).label
+                label.set_text(text)
+                labels.append(label)
+    setp(labels, color=_TEXT_BLACK_RGBA, fontsize=fontsize_labels)
+
+
+def _is_headless():
+    """
+    Check whether plots are being made without any display to show them on.
+    
+    Returns:
+        bool: True on Linux/Unix with no X11 or Wayland display and no
+        backend chosen through MPLBACKEND
+    """
+    if os.environ.get('MPLBACKEND') or sys.platform in ('darwin', 'win32'):
+        return False
+    return not (os.environ.get('DISPLAY') or os.environ.get('WAYLAND_DISPLAY'))
+
+
+def apply_project_style():
+    """
+    Apply the project style sheet on top of matplotlib's default style.
+    
+    The style is set through rcParams, so every figure created afterwards
+    picks up the brand colors, grid and borders without restyling. Call it
+    to style figures made with plain plt.subplots; init_styled_plot applies
+    the sheet to its own figures and does not need it.
+    """
+    import matplotlib.pyplot as plt
 
+    plt.style.use(['default', STYLE_FILE])
 
-def init_styled_plot(figsize=(12, 7)):
+
+def init_styled_plot(figsize=(12, 7), backend=None, rasterize_threshold=50_000,
+                     image_mode=False, dpi=None, crop_factor=1.0):
     """
     Initialize a figure and axis with consistent styling.
     
+    Without a display the non-interactive Agg backend is selected, which
+    renders much faster than a GUI backend when figures are only saved.
+    Dense ax.plot/ax.scatter calls are rasterized so vector output stays
+    bounded in size and render time regardless of the number of points;
+    this is done by the StyledAxes class in styled_axes.
+    
+    Agg render time scales with pixel count, so a crop_factor above 1
+    renders at dpi / crop_factor and leaves upscaling to the host. Live
+    views that copy fig.canvas.buffer_rgba() into a GUI texture get the
+    speedup directly (crop_factor=2 draws a quarter of the pixels), since
+    the GUI's upscale is cheap next to matplotlib's per-pixel work; the
+    price is a softer image.
+    
     Args:
         figsize: Figure size as (width, height) tuple
+        backend: Matplotlib backend to force (e.g. 'Agg'); None to detect
+        rasterize_threshold: Point count above which plot/scatter artists
+            are rasterized; None to never rasterize automatically
+        image_mode: Set up the axis for images: no grid, and imshow (direct
+            or through pyplot) defaults to nearest-neighbour drawing without
+            resampling
+        dpi: Target resolution of the figure; None for rcParams['figure.dpi']
+        crop_factor: Divisor applied to dpi for the actual render; 1.0
+            renders at full resolution
+        
+    Returns:
+        tuple: (figure, axis)
+        
+    Raises:
+        ValueError: If crop_factor is not positive
+    """
+    if crop_factor <= 0:
+        raise ValueError(f"crop_factor must be positive, got {crop_factor}")
+
+    import matplotlib
+
+    if backend is not None:
+        matplotlib.use(backend, force=True)
+    elif _is_headless():
+        matplotlib.use('Agg', force=True)
+
+    import matplotlib.pyplot as plt
+    from styled_axes import StyledAxes
+
+    if dpi is None:
+        dpi = plt.rcParams['figure.dpi']
+
+    # Create figure and axis already styled; the sheet is applied per call so
+    # a later plt.style.use elsewhere cannot leave these figures unstyled
+    with plt.style.context(STYLE_FILE):
+        fig, ax = plt.subplots(figsize=figsize, dpi=dpi / crop_factor,
+                               subplot_kw={'axes_class': StyledAxes})
+    ax.rasterize_threshold = rasterize_threshold
+    ax.image_mode = image_mode
+    
+    if image_mode:
+        ax.grid(False)
+    
+    return fig, ax
+
+
+def _limits_key(fig):
+    """Summarize the data and view limits of every axis in a figure."""
+    return tuple(ax.dataLim.bounds + ax.viewLim.bounds for ax in fig.axes)
+
+
+def _cached_tightbbox(fig, renderer):
+    """Return the padded tight bbox of fig, recomputed when limits change."""
+    key = _limits_key(fig)
+    cached = getattr(fig, '_cached_tightbbox', None)
+    if cached is None or cached[0] != key:
+        # Run the layout engine first (constrained_layout moves the axes)
+        fig.draw_without_rendering()
+        cached = (key, fig.get_tightbbox(renderer).padded(0.1))
+        fig._cached_tightbbox = cached
+    return cached[1]
+
+
+def save_styled(fig, path, dpi=100, reuse_bbox=False):
+    """
+    Save a figure, as a fast-to-encode PNG unless another format is named.
+    
+    PNGs are written with light zlib compression, trading some file size for
+    much less encoding time when exporting many figures. Vector formats such
+    as SVG are only used when the path explicitly ends in that suffix.
+    
+    Args:
+        fig: Matplotlib figure object
+        path: Output path; '.png' is appended unless it ends in the suffix
+            of a format matplotlib can write (e.g. 'sweep_L2.0' gets one)
+        dpi: Resolution in dots per inch
+        reuse_bbox: Reuse the tight bounding box computed on an earlier save
+            while the axes limits are unchanged, for loops that redraw the
+            same layout repeatedly
+        
+    Returns:
+        str: Path the figure was written to
+    """
+    path = os.fspath(path)
+    fmt = os.path.splitext(path)[1][1:].lower()
+    if fmt not in fig.canvas.get_supported_filetypes():
+        path += '.png'
+        fmt = 'png'
+
+    bbox_inches = 'tight'
+    if reuse_bbox:
+        bbox_inches = _cached_tightbbox(fig, fig.canvas.get_renderer())
+
+    kwargs = {}
+    if fmt == 'png':
+        kwargs['pil_kwargs'] = {'compress_level': 1}
+
+    fig.savefig(path, dpi=dpi, format=fmt, bbox_inches=bbox_inches,
+                facecolor=fig.get_facecolor(), **kwargs)
+    return path
+
+
+def reset_styled_plot(fig, ax):
+    """
+    Clear the data artists of a styled plot so the figure can be reused.
+    
+    Creating a figure is a large share of plot time, so when rendering many
+    frames (e.g. for a video) create the figure once with init_styled_plot
+    and call this before re-plotting each frame. Styling, labels and the
+    figure itself are kept; lines, collections, patches, texts, images and
+    the legend are removed and the color cycle restarts.
+    
+    Args:
+        fig: Matplotlib figure object
+        ax: Axis to clear
         
     Returns:
         tuple: (figure, axis)
     """
-    # Set the default style
-    plt.style.use('default')
+    import matplotlib.pyplot as plt
+
+    for artists in (ax.lines, ax.collections, ax.patches, ax.texts, ax.images):
+        for artist in list(artists):
+            artist.remove()
+
+    legend = ax.get_legend()
+    if legend is not None:
+        legend.remove()
+
+    ax.relim()
+    ax.autoscale_view()
+    with plt.style.context(STYLE_FILE):
+        ax.set_prop_cycle(None)
+    return fig, ax
+
+
+def init_blit_context(fig, ax, animated_artists):
+    """
+    Prepare an axis for fast redraws by blitting only its animated artists.
+    
+    The static parts of the figure are rendered once and cached; each update
+    restores that background and redraws just the animated artists. Create
+    the figure with init_styled_plot, plot the static content and the
+    artists to animate, then call the returned function after every change:
     
-    # Create figure and axis
-    fig, ax = plt.subplots(figsize=figsize)
+        fig, ax = init_styled_plot()
+        (line,) = ax.plot(t, buffer, color=PRIMARY_RED)
+        update = init_blit_context(fig, ax, [line])
+        for frame in frames:
+            line.set_ydata(frame)
+            update()
     
-    # Apply styling
-    apply_style(fig, ax)
+    Args:
+        fig: Matplotlib figure object
+        ax: Axis containing the animated artists
+        animated_artists: Artists that change between frames
+        
+    Returns:
+        callable: Function redrawing the animated artists onto the cached background
+    """
+    for artist in animated_artists:
+        artist.set_animated(True)
+
+    # Animated artists are left out of this draw, so the cached background
+    # holds only the static content
+    fig.canvas.draw()
+    background = fig.canvas.copy_from_bbox(ax.bbox)
+
+    def update():
+        fig.canvas.restore_region(background)
+        for artist in animated_artists:
+            ax.draw_artist(artist)
+        fig.canvas.blit(ax.bbox)
+
+    return update
+
+
+def __getattr__(name):
+    """
+    Lazily provide module attributes that require matplotlib.
     
-    return fig, ax 
\ No newline at end of file
+    Args:
+        name: Attribute name being looked up
+        
+    Returns:
+        The primary colormap for PRIMARY_CMAP
+    """
+    if name == 'PRIMARY_CMAP':
+        return get_primary_cmap()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")